@@ -6,18 +6,36 @@ import os
 load_dotenv()
 
 SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL")
+POOL_SIZE = 5
+# Connections opened at startup so the first requests don't pay for them
+POOL_WARM_SIZE = min(int(os.getenv("DB_POOL_WARM_SIZE", "2")), POOL_SIZE)
+# Seconds to wait for a new connection, so an unreachable database fails fast
+CONNECT_TIMEOUT = int(os.getenv("DB_CONNECT_TIMEOUT", "5"))
 
 # Create engine
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL,
     pool_pre_ping=True,  # Enable connection pool "pre-ping" feature
-    pool_size=5,  # Number of connections to keep open
+    pool_size=POOL_SIZE,  # Number of connections to keep open
     max_overflow=10,  # Max number of connections to create above pool_size
+    connect_args={"connect_timeout": CONNECT_TIMEOUT},
 )
 
 SessionLocal = sessionmaker(bind=engine, autocommit=False, autoflush=False)
 
 
+def warm_pool(size=POOL_WARM_SIZE):
+    # Check out `size` connections at once so the pool really opens that many,
+    # then hand them all back to be reused by requests
+    connections = []
+    try:
+        for _ in range(size):
+            connections.append(engine.connect())
+    finally:
+        for connection in connections:
+            connection.close()
+
+
 def get_db():
     db = SessionLocal()
     try:
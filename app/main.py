@@ -1,9 +1,12 @@
 from fastapi import FastAPI, Depends, HTTPException
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import HTMLResponse
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from fastapi.responses import HTMLResponse, JSONResponse
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session, configure_mappers
+from contextlib import asynccontextmanager
+import asyncio
+from app.db.session import SessionLocal, get_db, warm_pool
 from app.models.seat_notification import SeatNotification
 from app.models.theater import Theater
 from app.models.movie import Movie
@@ -21,7 +24,69 @@ logger = logging.getLogger(__name__)
 
 # uvicorn app.main:app --reload
 
-app = FastAPI()
+# Seconds between warm-up attempts after a failed one
+WARM_UP_RETRY_INTERVAL = 10
+
+
+def warm_up(app):
+    # Pay the one-off startup costs here instead of on the first requests
+    warm_pool()
+    configure_mappers()
+
+    # FastAPI builds the OpenAPI schema lazily on first use
+    app.openapi()
+
+    # Run the hot queries once so SQLAlchemy caches their compiled SQL.
+    # The filter values never match, so no rows are loaded
+    db = SessionLocal()
+    try:
+        db.query(Theater).filter(Theater.name == "").first()
+        db.query(Movie).filter(Movie.name == "").first()
+        db.query(Showtime).filter(Showtime.seating_url == "").first()
+        db.query(SeatNotification).filter(
+            SeatNotification.user_email == "",
+            SeatNotification.seat_number == "",
+            SeatNotification.showtime_id == -1,
+        ).first()
+        db.query(SeatNotification).filter(SeatNotification.id == -1).first()
+        db.query(Showtime).filter(Showtime.id == -1).first()
+        db.query(Movie).filter(Movie.id == -1).first()
+        db.query(Theater).filter(Theater.id == -1).first()
+        db.rollback()
+    finally:
+        db.close()
+
+    app.state.ready = True
+    logger.info("Warm-up complete")
+
+
+async def try_warm_up(app):
+    try:
+        await run_in_threadpool(warm_up, app)
+    except Exception as e:
+        logger.error(f"Error during warm-up: {str(e)}")
+
+
+async def retry_warm_up(app):
+    # One attempt at a time, so a down database can't pile up blocked threads
+    while not app.state.ready:
+        await asyncio.sleep(WARM_UP_RETRY_INTERVAL)
+        await try_warm_up(app)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    app.state.ready = False
+    await try_warm_up(app)
+    retry_task = None
+    if not app.state.ready:
+        retry_task = asyncio.create_task(retry_warm_up(app))
+    yield
+    if retry_task:
+        retry_task.cancel()
+
+
+app = FastAPI(lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -142,6 +207,20 @@ def send_email(
         return False
 
 
+@app.get("/healthz")
+async def healthz():
+    # Liveness only, never touches the database
+    return {"status": "ok"}
+
+
+@app.get("/readyz")
+async def readyz():
+    # Failed warm-ups are retried in the background by lifespan
+    if not getattr(app.state, "ready", False):
+        return JSONResponse(status_code=503, content={"status": "warming up"})
+    return {"status": "ready"}
+
+
 @app.post("/notifications")
 async def create_notification(
     request: NotificationRequest, db: Session = Depends(get_db)